@@ -7,17 +7,22 @@ Version: 2.0
 Streamlit Application Entry Point
 """
 
+import pandas as pd
 import streamlit as st
 from config.settings import PAGE_CONFIG
-from data.loaders import load_all_persisted_frames_cached, load_billers_master_cached
-from ui.file_upload import render_file_upload_section
+from data.loaders import (
+    load_all_persisted_frames_cached,
+    load_billers_master_cached,
+    save_all_persisted_frames,
+)
 from ui.sidebar import render_state_data
-from ui.tabs.tab_legalizations import render_tab_legalizations
-from ui.tabs.tab_manual_billing import render_tab_manual_billing
 from service.rips_service import map_document_to_name
-from ui.tabs.tab_billing_electronic import render_billing_electronic_section
 import plotly.io as pio
 
+# Copy-on-write avoids eager defensive copies in the filter/merge pipeline;
+# frames only duplicate their data when a view is actually written to.
+pd.set_option("mode.copy_on_write", True)
+
 pio.kaleido.scope.chromium_args = (
     "--headless",
     "--no-sandbox",
@@ -30,16 +35,26 @@ def init_session_state():
     if 'initialized' not in st.session_state:
         data = load_all_persisted_frames_cached()
 
-
-        st.session_state["ppl_legalizations_df"] = data.get("ppl_legalizations")
-        st.session_state["agreement_legalizations_df"] = data.get("agreement_legalizations")
-        st.session_state["rips_df"] = data.get("rips")
-        st.session_state["billers_df"] = data.get("billers")
-        st.session_state["electronic_billing_df"] = data.get("electronic_billing")
-        st.session_state["administrative_processes_df"] = data.get("administrative_processes")
+        # Only fill keys that are still empty so dataframes already loaded in
+        # this session (e.g. a fresh upload) are never overwritten from disk.
+        session_keys = {
+            "ppl_legalizations_df": "ppl_legalizations",
+            "agreement_legalizations_df": "agreement_legalizations",
+            "rips_df": "rips",
+            "billers_df": "billers",
+            "electronic_billing_df": "electronic_billing",
+            "administrative_processes_df": "administrative_processes",
+        }
+        for session_key, dataset_key in session_keys.items():
+            if st.session_state.get(session_key) is None:
+                st.session_state[session_key] = data.get(dataset_key)
 
         if st.session_state["billers_df"] is None:
             st.session_state["billers_df"] = load_billers_master_cached()
+            # Persist a parquet sidecar so the next session reads it with the
+            # fast loaders instead of re-parsing the Excel master.
+            if st.session_state["billers_df"] is not None:
+                save_all_persisted_frames({"billers": st.session_state["billers_df"]})
 
         if st.session_state["rips_df"] is not None and st.session_state["billers_df"] is not None:
             st.session_state["rips_df"] = map_document_to_name(
@@ -70,16 +85,23 @@ def main():
     with tab_home:
         render_home()
 
+    # Tab modules import lazily so the first paint (title + sidebar) is not
+    # blocked behind every tab's import chain; after the first run the
+    # imports are served from sys.modules and cost nothing.
     with tab_legalizations:
+        from ui.tabs.tab_legalizations import render_tab_legalizations
         render_tab_legalizations()
 
     with tab_electronic_billing:
+        from ui.tabs.tab_billing_electronic import render_billing_electronic_section
         render_billing_electronic_section()
 
     with tab_manual_billing:
+        from ui.tabs.tab_manual_billing import render_tab_manual_billing
         render_tab_manual_billing()
 
     with tab_load:
+        from ui.file_upload import render_file_upload_section
         render_file_upload_section()
 
 
@@ -5,13 +5,15 @@ Functions to load files from different sources and persist processed data as Par
 """
 
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Mapping
 
 import pandas as pd
 import streamlit as st
 
 from config.settings import FACTURADORES_FILE, FACTURADORES_SHEET, FILES
-from utils.file_helpers import load_from_parquet, read_file_robust, save_to_parquet
+from utils.file_helpers import EXCEL_ENGINE, load_from_parquet, read_file_robust, save_to_parquet
 
 # Canonical dataset keys (English)
 DATASET_TO_FILE_KEY = {
@@ -27,6 +29,10 @@ DATASET_TO_FILE_KEY = {
 # Required columns for processes dataset
 REQUIRED_PROCESS_COLUMNS = ("FECHA", "NOMBRE", "DOCUMENTO", "PROCESO", "CANTIDAD")
 
+# Low-cardinality string columns converted to category after load so isin /
+# equality filters downstream compare integer codes instead of Python strings.
+CATEGORY_COLUMNS = ("ESTADO", "Estado", "CONVENIO", "USUARIO FACTURÓ")
+
 # Error messages
 ERROR_MISSING_PROCESS_COLUMNS = "Missing required process columns: {columns}"
 ERROR_PROCESS_LOAD_FAILED = "Failed to load processes dataset: {error}"
@@ -44,7 +50,14 @@ def _normalize_billers_document_column(df: pd.DataFrame) -> pd.DataFrame:
     if "DOCUMENTO" not in df.columns:
         return df
 
-    doc_series = df["DOCUMENTO"].astype(str).str.strip()
+    doc_series = df["DOCUMENTO"]
+    if pd.api.types.is_integer_dtype(doc_series):
+        # Integer documents stringify clean; skip the strip and trailing-.0
+        # regex repair that only float/object columns need.
+        df["DOCUMENTO"] = doc_series.astype(str)
+        return df
+
+    doc_series = doc_series.astype(str).str.strip()
     doc_series = doc_series.str.replace(r"\.0$", "", regex=True)
     df["DOCUMENTO"] = doc_series
     return df
@@ -68,13 +81,58 @@ def _build_google_sheets_export_url(file_or_url: Any) -> Any:
     return file_or_url
 
 
+def _categorize_low_cardinality(df: pd.DataFrame | None) -> pd.DataFrame | None:
+    """Cast known low-cardinality string columns to category dtype."""
+    if df is None:
+        return df
+
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and (
+            pd.api.types.is_object_dtype(df[col])
+            or pd.api.types.is_string_dtype(df[col])
+        ):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _file_mtime(filepath: str) -> float | None:
+    """Return file modification time, or None when the file does not exist."""
+    try:
+        return os.path.getmtime(filepath)
+    except OSError:
+        return None
+
+
+@st.cache_data(show_spinner=False)
+def _load_parquet_cached(filepath: str, mtime: float | None) -> pd.DataFrame | None:
+    """
+    Load a parquet file memoized on (path, mtime).
+    The mtime doubles as cache key and existence check: unchanged files are
+    served from Streamlit's in-memory cache, and missing files (mtime None)
+    short-circuit without a second stat call in load_from_parquet.
+    """
+    if mtime is None:
+        return None
+    return _categorize_low_cardinality(load_from_parquet(filepath))
+
+
 def load_all_persisted_frames() -> dict[str, pd.DataFrame | None]:
-    """Load all persisted parquet datasets from parquet."""
-    """Load all persisted parquet datasets using canonical English keys."""
-    datasets = {}
-    for dataset_key, file_key in DATASET_TO_FILE_KEY.items():
-        datasets[dataset_key] = load_from_parquet(FILES[file_key])
-    return datasets
+    """
+    Load all persisted parquet datasets using canonical English keys.
+
+    Cold loads run in a thread pool: the Arrow parquet reader releases the
+    GIL, so I/O and decompression overlap across files and first-session
+    startup costs roughly the slowest file instead of the sum of all.
+    """
+    file_keys = list(DATASET_TO_FILE_KEY.items())
+    with ThreadPoolExecutor(max_workers=len(file_keys)) as executor:
+        futures = {
+            dataset_key: executor.submit(
+                _load_parquet_cached, FILES[file_key], _file_mtime(FILES[file_key])
+            )
+            for dataset_key, file_key in file_keys
+        }
+        return {dataset_key: future.result() for dataset_key, future in futures.items()}
 
 
 @st.cache_data(show_spinner=False, ttl=120)
@@ -83,15 +141,62 @@ def load_all_persisted_frames_cached() -> dict[str, pd.DataFrame | None]:
     return load_all_persisted_frames()
 
 
+@st.cache_data(show_spinner=False)
+def load_dataset_columns(dataset_key: str, columns: tuple[str, ...]) -> pd.DataFrame | None:
+    """
+    Load only the given columns of a persisted dataset.
+
+    Parquet's columnar layout makes the projection free on the read side;
+    use this for callers that need one or two columns (counts, option
+    lists) instead of materializing the full frame.
+    """
+    file_key = DATASET_TO_FILE_KEY.get(dataset_key)
+    if file_key is None:
+        return None
+    return load_from_parquet(FILES[file_key], columns=list(columns))
+
+
+def _frame_content_hash(df: pd.DataFrame | None) -> int | None:
+    """Cheap content hash used to detect unchanged frames before a rewrite."""
+    if df is None:
+        return None
+    try:
+        return int(pd.util.hash_pandas_object(df, index=False).sum())
+    except TypeError:
+        # Unhashable cell values (rare object columns): treat as changed.
+        return None
+
+
 def save_all_persisted_frames(data_by_dataset: Mapping[str, pd.DataFrame]) -> dict[str, bool]:
-    """Persist all provided datasets as parquet using canonical English keys."""
+    """
+    Persist all provided datasets as parquet using canonical English keys.
+
+    Frames whose content hash matches the one recorded at their last write
+    are skipped, so saving the whole session state only rewrites the
+    datasets that actually changed.
+    """
     results: dict[str, bool] = {}
 
     for dataset_key, df in data_by_dataset.items():
         file_key = DATASET_TO_FILE_KEY.get(dataset_key)
         if file_key is None:
             continue
+
+        sentinel_key = f"_parquet_hash_{dataset_key}"
+        content_hash = _frame_content_hash(df)
+        if (
+            content_hash is not None
+            and st.session_state.get(sentinel_key) == content_hash
+            # The clear flows delete the parquet but not the sentinel, so a
+            # stale hash must never skip the write when the file is gone.
+            and os.path.exists(FILES[file_key])
+        ):
+            results[dataset_key] = True
+            continue
+
         results[dataset_key] = save_to_parquet(df, FILES[file_key])
+        if results[dataset_key] and content_hash is not None:
+            st.session_state[sentinel_key] = content_hash
 
     return results
 
@@ -129,12 +234,26 @@ def _load_billers_from_secrets(secrets_source: Mapping[str, Any] | None = None)
     return None
 
 
+@st.cache_data(show_spinner=False)
+def _read_billers_excel_cached(filepath: str, sheet_name, mtime: float | None) -> pd.DataFrame:
+    """
+    Read and normalize the billers master Excel memoized on (path, mtime),
+    so unchanged files skip the openpyxl parse on warm reloads.
+    """
+    _ = mtime
+    df = pd.read_excel(filepath, sheet_name=sheet_name, engine=EXCEL_ENGINE)
+    df = _normalize_columns_upper(df)
+    return _normalize_billers_document_column(df)
+
+
 def _load_billers_from_file() -> pd.DataFrame | None:
     """Load billers master dataset from local Excel file."""
     try:
-        df = pd.read_excel(FACTURADORES_FILE, sheet_name=FACTURADORES_SHEET)
-        df = _normalize_columns_upper(df)
-        return _normalize_billers_document_column(df)
+        return _read_billers_excel_cached(
+            FACTURADORES_FILE,
+            FACTURADORES_SHEET,
+            _file_mtime(FACTURADORES_FILE),
+        )
     except Exception:
         return None
 
@@ -162,7 +281,7 @@ def load_billers_master_cached(secrets_source: Mapping[str, Any] | None = None)
 def load_uploaded_dataframe(file, header_marker: str) -> pd.DataFrame | None:
     """Load uploaded file by auto-detecting real header row using marker."""
     df, _ = read_file_robust(file, header_marker)
-    return df
+    return _categorize_low_cardinality(df)
 
 
 def load_processes_data(file_or_url) -> pd.DataFrame:
@@ -171,7 +290,7 @@ def load_processes_data(file_or_url) -> pd.DataFrame:
     """
     try:
         source = _build_google_sheets_export_url(file_or_url)
-        df = pd.read_excel(source)
+        df = pd.read_excel(source, engine=EXCEL_ENGINE)
         df = _normalize_columns_upper(df)
 
         missing = [col for col in REQUIRED_PROCESS_COLUMNS if col not in df.columns]
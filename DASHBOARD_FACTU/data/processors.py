@@ -24,8 +24,36 @@ COMPARISON_MODE_DOCUMENT = "DOCUMENTO"
 COMPARISON_MODE_NAME = "NOMBRE"
 
 def _normalize_text_series(series: pd.Series) -> pd.Series:
-    """Normalize text values for stable matching."""
-    return series.astype(str).str.strip().str.upper()
+    """
+    Normalize text values for stable matching.
+    Prefers Arrow-backed strings so strip/upper run as C kernels instead of
+    per-element Python string calls.
+    """
+    try:
+        normalized = series.astype("string[pyarrow]")
+    except (TypeError, ValueError):
+        normalized = series.astype(str)
+    return normalized.str.strip().str.upper()
+
+
+def _filter_by_valid_states(
+        df: pd.DataFrame,
+        state_column: str,
+        valid_states,
+) -> pd.DataFrame:
+    """
+    Keep rows whose normalized state is one of valid_states.
+
+    The column is rebuilt as a Categorical whose fixed categories are the
+    valid states, so membership reduces to a codes >= 0 check over integer
+    codes and downstream equality/isin filters also compare codes instead
+    of Python strings.
+    """
+    states = pd.Categorical(
+        _normalize_text_series(df[state_column]), categories=list(valid_states)
+    )
+    df[state_column] = states
+    return df[states.codes >= 0]
 
 
 def _normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
@@ -35,13 +63,6 @@ def _normalize_column_names(df: pd.DataFrame) -> pd.DataFrame:
     return df_copy
 
 
-def _normalize_object_columns_in_place(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize all object columns (trim + uppercase)."""
-    for col in df.columns:
-        if df[col].dtype == object:
-            df[col] = _normalize_text_series(df[col])
-    return df
-
 def _ensure_required_columns(df: pd.DataFrame, required_columns: tuple[str, ...]) -> None:
     """Raise ValueError when required columns are missing."""
     missing = [col for col in required_columns if col not in df.columns]
@@ -70,14 +91,15 @@ def split_legalizations(
     result_df = parse_date_column(result_df, date_column)
 
     if state_column in result_df.columns:
-        result_df[state_column] = _normalize_text_series(result_df[state_column])
-        result_df = result_df[result_df[state_column].isin(VALID_STATES_LEGALIZATIONS)]
+        result_df = _filter_by_valid_states(result_df, state_column, VALID_STATES_LEGALIZATIONS)
 
     if agreement_column not in result_df.columns:
         return None, None
 
-    ppl_df = result_df[result_df[agreement_column] == PPL_NAME].copy()
-    agreements_df = result_df[result_df[agreement_column] != PPL_NAME].copy()
+    # One comparison pass feeds both partitions instead of scanning twice.
+    ppl_mask = result_df[agreement_column] == PPL_NAME
+    ppl_df = result_df[ppl_mask].copy()
+    agreements_df = result_df[~ppl_mask].copy()
     return ppl_df, agreements_df
 
 def process_rips_data(df: pd.DataFrame,state_column: str = "ESTADO",date_column: str = "FECHA_REAL",
@@ -90,8 +112,7 @@ def process_rips_data(df: pd.DataFrame,state_column: str = "ESTADO",date_column:
     result_df = parse_date_column(result_df, date_column)
 
     if state_column in result_df.columns:
-        result_df[state_column] = _normalize_text_series(result_df[state_column])
-        result_df = result_df[result_df[state_column].isin(VALID_STATES_RIPS)]
+        result_df = _filter_by_valid_states(result_df, state_column, VALID_STATES_RIPS)
 
     return result_df
 
@@ -120,8 +141,9 @@ def process_electronic_billing_data(
     result_df = parse_date_column(result_df, date_column)
 
     if state_column in result_df.columns:
-        result_df[state_column] = _normalize_text_series(result_df[state_column])
-        result_df = result_df[result_df[state_column].isin(VALID_STATES_INVOICING_ELECTRONIC)]
+        result_df = _filter_by_valid_states(
+            result_df, state_column, VALID_STATES_INVOICING_ELECTRONIC
+        )
 
     return result_df
 
@@ -137,6 +159,21 @@ def merge_with_billers(
     if user_column not in df.columns or "USUARIO" not in billers_df.columns:
         return df
 
+    # The master is a small dimension table; in the common case (unique key,
+    # no column collisions, matching key name) attaching its columns with
+    # per-column map skips the hash-join realignment of the full left frame.
+    extra_columns = [col for col in billers_df.columns if col != "USUARIO"]
+    if (
+        user_column == "USUARIO"
+        and billers_df["USUARIO"].is_unique
+        and not any(col in df.columns for col in extra_columns)
+    ):
+        lookup = billers_df.set_index("USUARIO")
+        result_df = df.copy()
+        for col in extra_columns:
+            result_df[col] = result_df[user_column].map(lookup[col])
+        return result_df
+
     return pd.merge(df,
                     billers_df,
                     left_on=user_column,
@@ -160,8 +197,14 @@ def merge_billing_with_electronic_billing(
     result_df = billing_df.copy()
     normalized_e_billing_df = electronic_billing_df.copy()
 
-    _normalize_object_columns_in_place(result_df)
-    _normalize_object_columns_in_place(normalized_e_billing_df)
+    # Only the join/filter columns participate in the match; normalizing the
+    # whole frames would copy every object column for nothing.
+    for col in ("NRO_FACTURACLI",):
+        if col in result_df.columns:
+            result_df[col] = _normalize_text_series(result_df[col])
+    for col in ("FACTURA", "USUARIO", "ESTADO", "Estado"):
+        if col in normalized_e_billing_df.columns:
+            normalized_e_billing_df[col] = _normalize_text_series(normalized_e_billing_df[col])
 
     state_col = "ESTADO" if "ESTADO" in normalized_e_billing_df.columns else "Estado"
     if state_col in normalized_e_billing_df.columns:
@@ -180,6 +223,9 @@ def merge_billing_with_electronic_billing(
         )
 
         if "NRO_FACTURACLI" in result_df.columns:
+            # Series.map against the deduplicated index benchmarks well ahead
+            # of a merge here: it writes one column without the row realign /
+            # frame reassembly a left-merge pays for.
             result_df["USUARIO"] = result_df["NRO_FACTURACLI"].map(user_map)
 
     return result_df
@@ -227,14 +273,62 @@ def aggregate_records_by_user(
 
     result_df = df.copy()
 
+    # observed=True keeps categorical user columns from emitting empty
+    # combinations; sort=False skips an unneeded sort of the group keys.
     if group_by_date and date_column and date_column in result_df.columns:
-        result_df["DATE"] = pd.to_datetime(result_df[date_column], errors="coerce").dt.date
-        agg_df = result_df.groupby([user_column, "DATE"]).size().reset_index(name="COUNT")
+        result_df["DATE"] = pd.to_datetime(result_df[date_column], errors="coerce").dt.normalize()
+        agg_df = (
+            result_df.groupby([user_column, "DATE"], sort=False, observed=True)
+            .size()
+            .reset_index(name="COUNT")
+        )
+    elif isinstance(result_df[user_column].dtype, pd.CategoricalDtype):
+        # groupby(observed=True) rather than value_counts, which would emit
+        # zero-count rows for unobserved categories. Sort by count so the
+        # exported per-user listing stays deterministic (first-appearance
+        # order is what sort=False would otherwise leak into the report).
+        agg_df = (
+            result_df.groupby(user_column, sort=False, observed=True)
+            .size()
+            .reset_index(name="COUNT")
+            .sort_values("COUNT", ascending=False, ignore_index=True)
+        )
     else:
-        agg_df = result_df.groupby(user_column).size().reset_index(name="COUNT")
+        # Single-column counting dispatches straight to the value_counts
+        # hash kernel without building a Grouper; callers don't rely on
+        # row order here.
+        agg_df = (
+            result_df[user_column]
+            .value_counts()
+            .rename_axis(user_column)
+            .reset_index(name="COUNT")
+        )
 
     return agg_df
 
+def filter_by_user_selection(
+        df: pd.DataFrame,
+        user_column: str,
+        selected_users,
+):
+    """
+    Keep rows whose user column value is in selected_users.
+
+    Categorical user columns resolve membership once over the (few) categories
+    and index the result with the integer codes, instead of hashing every row
+    value with Series.isin.
+    """
+    series = df[user_column]
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        selected_categories = series.cat.categories.isin(list(selected_users))
+        codes = series.cat.codes.to_numpy()
+        mask = (codes >= 0) & selected_categories[codes]
+        return df[mask]
+
+    return df[series.isin(selected_users)]
+
+
 def filter_by_billers(
         df: pd.DataFrame,
         billers_df: pd.DataFrame,
@@ -254,19 +348,16 @@ def filter_by_billers(
     if comparison_mode not in billers_df.columns:
         return df
 
-    valid_values = (
+    valid_values = frozenset(
         billers_df[comparison_mode]
         .dropna()
         .astype(str)
         .str.strip()
         .str.upper()
         .unique()
-        .tolist()
     )
 
-    result_df = df.copy()
-    result_df["_user_norm"] = _normalize_text_series(result_df[user_column])
-    filtered_df = result_df[result_df["_user_norm"].isin(valid_values)].copy()
-    filtered_df = filtered_df.drop(columns=["_user_norm"])
-
-    return filtered_df
+    # The normalized key only feeds the mask; keeping it as a standalone
+    # series avoids materializing and dropping a throwaway column.
+    user_key = _normalize_text_series(df[user_column])
+    return df[user_key.isin(valid_values)]
@@ -4,6 +4,8 @@ Data validation
 Functions to validate dataframe structure and required columns.
 """
 
+from functools import lru_cache
+
 import pandas as pd
 from config.settings import COLUMN_NAMES
 
@@ -71,21 +73,32 @@ def validate_columns_presence(df: pd.DataFrame, required_columns):
     return len(missing) == 0, missing
 
 
+@lru_cache(maxsize=256)
+def _first_variant_in_columns(variants: tuple, columns: frozenset) -> str | None:
+    """Resolve the first variant present in columns, memoized per signature."""
+    for variant in variants:
+        if variant in columns:
+            return variant
+    return None
+
+
 def find_first_column_variant(df: pd.DataFrame, column_variants):
     """
     Find first matching column name from provided variants.
 
+    The probe is memoized on the (variants, columns) signature: the same
+    handful of schemas is probed many times per rerun across the services,
+    so repeat lookups skip the scan entirely.
+
     Returns:
         str | None: Matching column name or None.
     """
     if _is_empty_dataframe(df):
         return None
 
-    for variant in _coerce_variants(column_variants):
-        if variant in df.columns:
-            return variant
-
-    return None
+    return _first_variant_in_columns(
+        tuple(_coerce_variants(column_variants)), frozenset(df.columns)
+    )
 
 
 def validate_legalizations_dataframe(df: pd.DataFrame):
@@ -4,6 +4,8 @@ Business logic - Billers
 Functions to manage biller-related information.
 """
 
+import streamlit as st
+
 from data.loaders import load_billers_master
 
 USER_LOOKUP_COLUMNS = "NOMBRE"
@@ -78,6 +80,13 @@ def get_billers_list(billers_df=None, dataframes=None, session_state=None):
 
     return []
 
+
+@st.cache_data(show_spinner=False, ttl=300)
+def get_billers_list_cached(billers_df=None):
+    """Cached wrapper for the billers list built from the master dataframe."""
+    return get_billers_list(billers_df)
+
+
 def get_biller_info(user, billers_df=None):
     """
     Return detailed biller information by user name/identifier.
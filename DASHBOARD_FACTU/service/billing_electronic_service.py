@@ -240,7 +240,7 @@ def get_billing_with_user(billing_df, electronic_billing_df, billers_df=None):
 
     billing_by_user_df = (
         valid_user_rows_df
-        .groupby(user_col, as_index=False)[VALUE_COLUMN]
+        .groupby(user_col, as_index=False, observed=True, sort=False)[VALUE_COLUMN]
         .sum()
         .rename(columns={VALUE_COLUMN: "COUNT"})
         .sort_values("COUNT", ascending=False)
@@ -254,6 +254,12 @@ def get_billing_with_user(billing_df, electronic_billing_df, billers_df=None):
     }
 
 
+@st.cache_data(show_spinner=False, ttl=300)
+def get_billing_with_user_cached(billing_df, electronic_billing_df, billers_df=None):
+    """Cached wrapper for the productivity base; inputs only change on upload."""
+    return get_billing_with_user(billing_df, electronic_billing_df, billers_df)
+
+
 def calculate_billing_productivity(df):
     """
     Calculate electronic billing productivity with dual metrics:
@@ -279,7 +285,7 @@ def calculate_billing_productivity(df):
     if user_col:
         by_user_dual = (
             prepared_df
-            .groupby(user_col, as_index=False)
+            .groupby(user_col, as_index=False, observed=True, sort=False)
             .agg(
                 REGISTROS=(user_col, "size"),
                 VALOR_TERCERO=(VALUE_COLUMN, "sum"),
@@ -297,7 +303,7 @@ def calculate_billing_productivity(df):
     by_date_legacy = None
     if date_col:
         temp_df = prepared_df.dropna(subset=[date_col]).copy()
-        temp_df["DATE"] = pd.to_datetime(temp_df[date_col], errors="coerce").dt.date
+        temp_df["DATE"] = pd.to_datetime(temp_df[date_col], errors="coerce").dt.normalize()
         temp_df = temp_df.dropna(subset=["DATE"])
 
         by_date_dual = (
@@ -11,6 +11,7 @@ from config import COLUMN_NAMES_LEGALIZATIONS
 from data.processors import (
     aggregate_records_by_user,
     filter_by_billers ,
+    filter_by_user_selection,
     merge_with_billers,
     split_legalizations
 
@@ -112,11 +113,17 @@ def filter_legalizations(df, start_date, end_date, selected_users=None):
     if _is_user_filter_active(selected_users):
         user_col = find_first_column_variant(filtered_df, COLUMN_NAMES_LEGALIZATIONS["usuario"])
         if user_col and user_col in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df[user_col].isin(selected_users)]
+            filtered_df = filter_by_user_selection(filtered_df, user_col, selected_users)
 
     return filtered_df
 
 
+@st.cache_data(show_spinner=False, ttl=300)
+def filter_legalizations_cached(df, start_date, end_date, selected_users=None):
+    """Cached wrapper for legalizations filtering, keyed on frame and filters."""
+    return filter_legalizations(df, start_date, end_date, selected_users)
+
+
 def calculate_legalizations_productivity(df, category="PPL"):
     """Calculate productivity metrics for legalizations."""
     if df is None or df.empty:
@@ -136,7 +143,7 @@ def calculate_legalizations_productivity(df, category="PPL"):
     by_date = None
     if date_col:
         temp_df = df.copy()
-        temp_df["DATE"] = pd.to_datetime(temp_df[date_col]).dt.date
+        temp_df["DATE"] = pd.to_datetime(temp_df[date_col]).dt.normalize()
         by_date = temp_df.groupby("DATE").size().reset_index(name="COUNT")
 
     daily_average = 0
@@ -12,6 +12,7 @@ from data.processors import (
     merge_with_billers,
     aggregate_records_by_user,
     filter_by_billers,
+    filter_by_user_selection,
 )
 from data.validators import (
     validate_rips_dataframe,
@@ -24,6 +25,32 @@ from utils.date_helpers import filter_by_date_range
 # Centralized error messages.
 ERROR_VALIDATION_FAILED = "RIPS validation failed"
 
+def _document_to_name_map(billers_df: pd.DataFrame) -> pd.Series | None:
+    """Build the normalized DOCUMENTO -> NOMBRE mapping Series."""
+    if "DOCUMENTO" not in billers_df.columns or "NOMBRE" not in billers_df.columns:
+        return None
+
+    # Work on a two-column frame instead of copying the whole billers master.
+    return (
+        billers_df[["DOCUMENTO", "NOMBRE"]]
+        .assign(
+            DOCUMENTO=lambda d: d["DOCUMENTO"].astype(str).str.strip().str.upper(),
+            NOMBRE=lambda d: d["NOMBRE"].astype(str).str.strip().str.upper(),
+        )
+        .dropna(subset=["DOCUMENTO", "NOMBRE"])
+        .drop_duplicates(subset=["DOCUMENTO"])
+        .set_index("DOCUMENTO")["NOMBRE"]
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=600)
+def _document_to_name_dict_cached(billers_df: pd.DataFrame) -> dict[str, str] | None:
+    """Cached DOCUMENTO -> NOMBRE dict, shared across reruns and sessions."""
+    mapping = _document_to_name_map(billers_df)
+    if mapping is None:
+        return None
+    return mapping.to_dict()
+
 def _build_process_error_result(message):
     """Standard error payload for RIPS processing."""
     return {
@@ -92,11 +119,17 @@ def filter_rips(df, start_date, end_date, selected_users=None):
     if _is_user_filter_active(selected_users):
         user_col = find_first_column_variant(filtered_df, COLUMN_NAMES["usuario"])
         if user_col and user_col in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df[user_col].isin(selected_users)]
+            filtered_df = filter_by_user_selection(filtered_df, user_col, selected_users)
 
     return filtered_df
 
 
+@st.cache_data(show_spinner=False, ttl=300)
+def filter_rips_cached(df, start_date, end_date, selected_users=None):
+    """Cached wrapper for RIPS filtering, keyed on frame and filter values."""
+    return filter_rips(df, start_date, end_date, selected_users)
+
+
 def map_document_to_name(rips_df, billers_df):
     """
     Replace biller DOCUMENT value with NOMBRE in RIPS user column.
@@ -111,31 +144,11 @@ def map_document_to_name(rips_df, billers_df):
     if user_col is None:
         return rips_df
 
-    if "DOCUMENTO" not in billers_df.columns or "NOMBRE" not in billers_df.columns:
+    document_to_name_map = _document_to_name_dict_cached(billers_df)
+    if not document_to_name_map:
         return rips_df
 
     result_df = rips_df.copy()
-    normalized_billers_df = billers_df.copy()
-
-    normalized_billers_df["DOCUMENTO"] = (
-        normalized_billers_df["DOCUMENTO"]
-        .astype(str)
-        .str.strip()
-        .str.upper()
-    )
-    normalized_billers_df["NOMBRE"] = (
-        normalized_billers_df["NOMBRE"]
-        .astype(str)
-        .str.strip()
-        .str.upper()
-    )
-
-    document_to_name_map = (
-        normalized_billers_df
-        .dropna(subset=["DOCUMENTO", "NOMBRE"])
-        .drop_duplicates(subset=["DOCUMENTO"])
-        .set_index("DOCUMENTO")["NOMBRE"]
-    )
 
     result_df[user_col] = (
         result_df[user_col]
@@ -168,7 +181,7 @@ def calculate_rips_productivity(df):
     by_date = None
     if date_col:
         temp_df = df.copy()
-        temp_df["DATE"] = pd.to_datetime(temp_df[date_col]).dt.date
+        temp_df["DATE"] = pd.to_datetime(temp_df[date_col]).dt.normalize()
         by_date = temp_df.groupby("DATE").size().reset_index(name="COUNT")
 
     daily_average = 0
@@ -42,6 +42,12 @@ def show_info_message(message):
     st.info(f"ℹ️ {message}")
 
 
+@st.cache_data(show_spinner=False)
+def _dataframe_to_csv_bytes(df):
+    """Serialize a dataframe to CSV bytes, memoized across reruns."""
+    return df.to_csv(index=False).encode('utf-8')
+
+
 def create_download_button(df, filename, label="📥 Descargar datos"):
     """
     Create download button.
@@ -49,7 +55,7 @@ def create_download_button(df, filename, label="📥 Descargar datos"):
     if df is None or df.empty:
         return
 
-    csv = df.to_csv(index=False).encode('utf-8')
+    csv = _dataframe_to_csv_bytes(df)
     st.download_button(
         label=label,
         data=csv,
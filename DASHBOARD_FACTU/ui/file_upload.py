@@ -4,9 +4,12 @@ File Upload Section
 Interface for uploading files and processing data.
 """
 
+import os
+import traceback
+
 import streamlit as st
 
-from config.settings import COLUMN_MARKERS, COLUMN_NAMES
+from config.settings import COLUMN_MARKERS, COLUMN_NAMES, FILES
 from data.loaders import (
     load_billers_master_cached,
     load_uploaded_dataframe,
@@ -75,19 +78,18 @@ def clear_data_type(session_keys, file_keys, nombre):
 
     """Clean a specific type of data."""
 
-    import os
-    from config.settings import FILES
-
     # Limpiar session_state
     for key in session_keys:
         if key in st.session_state:
             st.session_state[key] = None
 
-    # Eliminar archivos parquet
+    # Eliminar archivos parquet (unlink directly; a missing file is fine)
     for file_key in file_keys:
-        if file_key in FILES and os.path.exists(FILES[file_key]):
+        if file_key in FILES:
             try:
                 os.remove(FILES[file_key])
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 show_error_message(f"Error al eliminar archivo: {e}")
                 return
@@ -99,8 +101,6 @@ def clear_data_type(session_keys, file_keys, nombre):
 
 def clear_all_data():
     """Clear all uploaded data."""
-    import os
-    from config.settings import FILES
 
     # Limpiar session_state
     keys_to_clear = [
@@ -118,9 +118,11 @@ def clear_all_data():
 
     files_to_delete = ["PPL", "Convenios", "RIPS", "Facturacion", "FacturacionElectronica", "ArchivoProcesos"]
     for file_key in files_to_delete:
-        if file_key in FILES and os.path.exists(FILES[file_key]):
+        if file_key in FILES:
             try:
                 os.remove(FILES[file_key])
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 show_error_message(f"Error al eliminar {file_key}: {e}")
                 return
@@ -198,7 +200,6 @@ def render_legalizaciones_upload():
 
             except Exception as e:
                 show_error_message(f"Error inesperado: {e}")
-                import traceback
                 st.code(traceback.format_exc())
 
 """
@@ -253,7 +254,6 @@ def render_rips_upload():
 
             except Exception as e:
                 show_error_message(f"Error inesperado: {e}")
-                import traceback
                 st.code(traceback.format_exc())
 """
                 
@@ -292,7 +292,6 @@ def render_facturacion_electronica_upload():
 
             except Exception as e:
                 show_error_message(f"Error inesperado: {e}")
-                import traceback
                 st.code(traceback.format_exc())
 
 
@@ -8,7 +8,7 @@ import pandas as pd
 import streamlit as st
 
 from utils.date_helpers import get_default_date_range
-from service.billers_service import get_billers_list
+from service.billers_service import get_billers_list_cached
 
 
 def render_date_filter(key_prefix=""):
@@ -38,7 +38,7 @@ def render_user_filter(df_facturadores, key_prefix=""):
     """
     Render an independent biller/user filter.
     """
-    billers_list = get_billers_list(df_facturadores)
+    billers_list = get_billers_list_cached(df_facturadores)
 
     if not billers_list:
         st.info("No hay facturadores disponibles.")
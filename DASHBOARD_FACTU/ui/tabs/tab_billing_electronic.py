@@ -13,7 +13,7 @@ from data.validators import find_first_column_variant
 from service.billing_electronic_service import (
     calculate_billing_productivity,
     filter_billing,
-    get_billing_with_user,
+    get_billing_with_user_cached,
     prepare_electronic_billing_df_cached,
 
 )
@@ -137,7 +137,7 @@ def render_billing_electronic_section():
         show_info_message("No hay datos que coincidan con los filtros seleccionados.")
         return
 
-    result = get_billing_with_user(
+    result = get_billing_with_user_cached(
         billing_df=None,
         electronic_billing_df=filtered_e_billing_df,
         billers_df=None,
@@ -14,7 +14,7 @@ from config.settings import COLUMN_NAMES, COLUMN_NAMES_LEGALIZATIONS
 from data.validators import find_first_column_variant
 from service.legalizations_service import (
     calculate_legalizations_productivity_cached,
-    filter_legalizations,
+    filter_legalizations_cached,
 )
 from service.report_service import build_legalizations_report_cached
 from utils.excel_exporter import export_legalizations_report_cached
@@ -29,6 +29,7 @@ ALL_OPTION = "Todos"
 # User options helper — merges users from both datasets
 # ---------------------------------------------------------------------------
 
+@st.cache_data(show_spinner=False, ttl=300)
 def _build_combined_user_options(
         ppl_df: pd.DataFrame | None,
         agreements_df: pd.DataFrame | None,
@@ -97,8 +98,8 @@ def render_tab_legalizations():
     # ------------------------------------------------------------------
     # Apply shared filters to both datasets
     # ------------------------------------------------------------------
-    filtered_ppl_df = filter_legalizations(ppl_df, start_date, end_date, selected_users)
-    filtered_agreements_df = filter_legalizations(agreements_df, start_date, end_date, selected_users)
+    filtered_ppl_df = filter_legalizations_cached(ppl_df, start_date, end_date, selected_users)
+    filtered_agreements_df = filter_legalizations_cached(agreements_df, start_date, end_date, selected_users)
 
     # ------------------------------------------------------------------
     # Excel download — uses already-filtered dataframes
@@ -113,8 +114,8 @@ def render_tab_legalizations():
         with col4:
             prev_end = st.date_input("Fin período anterior", key="leg_prev_end")
 
-        prev_ppl_df = filter_legalizations(ppl_df, prev_start, prev_end, selected_users)
-        prev_agreements_df = filter_legalizations(agreements_df, prev_start, prev_end, selected_users)
+        prev_ppl_df = filter_legalizations_cached(ppl_df, prev_start, prev_end, selected_users)
+        prev_agreements_df = filter_legalizations_cached(agreements_df, prev_start, prev_end, selected_users)
 
     period = _period_label(start_date, end_date)
     filename_suffix = f"_{selected_user}" if selected_users else ""
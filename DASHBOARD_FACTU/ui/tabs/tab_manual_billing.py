@@ -66,8 +66,11 @@ def _clear_processes_data():
     st.session_state["administrative_processes_df"] = None
 
     process_file = FILES.get("ArchivoProcesos")
-    if process_file and os.path.exists(process_file):
-        os.remove(process_file)
+    if process_file:
+        try:
+            os.remove(process_file)
+        except FileNotFoundError:
+            pass
     st.cache_data.clear()
 
 
@@ -9,7 +9,7 @@ import streamlit as st
 
 from config.settings import COLUMN_NAMES
 from data.validators import find_first_column_variant
-from service.rips_service import calculate_rips_productivity_cached, filter_rips
+from service.rips_service import calculate_rips_productivity_cached, filter_rips_cached
 from ui.visualizations import plot_productivity_charts
 from service.report_service import build_rips_report_cached
 from utils.excel_exporter import export_rips_report_cached
@@ -56,7 +56,7 @@ def render_tab_rips():
     selected_user = render_single_select("User", user_options, key="rips_user")
     selected_users = None if selected_user == ALL_OPTION else [selected_user]
 
-    filtered_df = filter_rips(
+    filtered_df = filter_rips_cached(
         df_rips,
         start_date,
         end_date,
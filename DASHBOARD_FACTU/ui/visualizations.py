@@ -7,32 +7,11 @@ Functions for creating graphs with Plotly and Matplotlib.
 import streamlit as st
 import plotly.express as px
 
-def plot_bar_chart(df, x_col, y_col, title, color=None, sortable=True, sort_key=None):
-    """
-    Create a bar chart with Plotly.
-    """
-    if df is None or df.empty:
-        st.info("No hay datos para graficar.")
-        return
-
-    df_plot = df.copy()
-
-    if sortable:
-        col1, col2 = st.columns([3, 1])
-        with col2:
-            sort_key_suffix = f"_{sort_key}" if sort_key else ""
-            orden = st.selectbox(
-                "Ordenar por:",
-                options=["Sin ordenar", "Mayor a Menor", "Menor a Mayor"],
-                key=f"sort_bar{sort_key_suffix}",
-                index=1
-            )
-
-            if orden == "Mayor a Menor":
-                df_plot = df_plot.sort_values(by=y_col, ascending=False)
-            elif orden == "Menor a Mayor":
-                df_plot = df_plot.sort_values(by=y_col, ascending=True)
 
+@st.cache_data(show_spinner=False)
+def _build_bar_figure(df_plot, x_col, y_col, title, color):
+    """Build the bar figure from already-sorted data, memoized across reruns."""
+    df_plot = df_plot.copy()
     df_plot[x_col] = df_plot[x_col].astype(str)
 
     fig = px.bar(
@@ -60,6 +39,63 @@ def plot_bar_chart(df, x_col, y_col, title, color=None, sortable=True, sort_key=
         showlegend=True if color else False,
         xaxis_type='category'
     )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _build_line_figure(df_plot, x_col, y_col, title, color):
+    """Build the line figure from already-sorted data, memoized across reruns."""
+    fig = px.line(
+        df_plot,
+        x=x_col,
+        y=y_col,
+        title=title,
+        color=color,
+        markers=True
+    )
+    fig.update_traces(
+        hovertemplate="%{x}<br>Valor: %{y:,.0f}<extra></extra>"
+    )
+
+    fig.update_yaxes(
+        tickformat=",.0f",
+        separatethousands=True
+    )
+
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+
+def plot_bar_chart(df, x_col, y_col, title, color=None, sortable=True, sort_key=None):
+    """
+    Create a bar chart with Plotly.
+
+    The sort selector stays here (widgets cannot live inside cached code);
+    figure construction is delegated to the cached builder.
+    """
+    if df is None or df.empty:
+        st.info("No hay datos para graficar.")
+        return
+
+    df_plot = df.copy()
+
+    if sortable:
+        col1, col2 = st.columns([3, 1])
+        with col2:
+            sort_key_suffix = f"_{sort_key}" if sort_key else ""
+            orden = st.selectbox(
+                "Ordenar por:",
+                options=["Sin ordenar", "Mayor a Menor", "Menor a Mayor"],
+                key=f"sort_bar{sort_key_suffix}",
+                index=1
+            )
+
+            if orden == "Mayor a Menor":
+                df_plot = df_plot.sort_values(by=y_col, ascending=False)
+            elif orden == "Menor a Mayor":
+                df_plot = df_plot.sort_values(by=y_col, ascending=True)
+
+    fig = _build_bar_figure(df_plot, x_col, y_col, title, color)
 
     st.plotly_chart(fig, width = "stretch")
 
@@ -67,6 +103,9 @@ def plot_bar_chart(df, x_col, y_col, title, color=None, sortable=True, sort_key=
 def plot_line_chart(df, x_col, y_col, title, color=None, sortable=True, sort_key=None):
     """
     Create a line graph with Plotly.
+
+    The sort selector stays here (widgets cannot live inside cached code);
+    figure construction is delegated to the cached builder.
     """
     if df is None or df.empty:
         st.info("No hay datos para graficar.")
@@ -91,24 +130,7 @@ def plot_line_chart(df, x_col, y_col, title, color=None, sortable=True, sort_key
             else:  # Por Fecha
                 df_plot = df_plot.sort_values(by=x_col)
 
-    fig = px.line(
-        df_plot,
-        x=x_col,
-        y=y_col,
-        title=title,
-        color=color,
-        markers=True
-    )
-    fig.update_traces(
-        hovertemplate="%{x}<br>Valor: %{y:,.0f}<extra></extra>"
-    )
-
-    fig.update_yaxes(
-        tickformat=",.0f",
-        separatethousands=True
-    )
-
-    fig.update_layout(xaxis_tickangle=-45)
+    fig = _build_line_figure(df_plot, x_col, y_col, title, color)
 
     st.plotly_chart(fig, width = "stretch")
 
@@ -179,7 +201,7 @@ def plot_billing_electronic_records_by_user(df_base, user_col):
 
     df_registros = (
         df_base
-        .groupby(user_col, as_index=False)
+        .groupby(user_col, as_index=False, observed=True, sort=False)
         .size()
         .rename(columns={"size": "REGISTROS"})
         .sort_values("REGISTROS", ascending=False)
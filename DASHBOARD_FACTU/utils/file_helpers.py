@@ -4,51 +4,126 @@ File Management Utilities
 Auxiliary functions for reading, writing, and manipulating files.
 """
 
+import csv
+import io
+
+import numpy as np
 import pandas as pd
 import os
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+
+# Header rows live near the top of the sheet; scanning a short prefix avoids
+# parsing the whole file twice just to locate them.
+HEADER_SCAN_ROWS = 50
+CSV_HEADER_SCAN_LINES = 200
+
+# Prefer the Rust-based calamine engine for Excel parsing (5-20x faster than
+# openpyxl); fall back to openpyxl where python-calamine is not installed.
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = "openpyxl"
 
 
 def save_to_parquet(df, filepath):
     """
     Save a DataFrame in Parquet format.
+
+    Keeps native dtypes (datetime/int/float) so the load side does not have
+    to re-parse them; convert_dtypes upgrades object columns to clean typed
+    columns (numeric, string) before they reach the Arrow writer.
     """
     if df is None or df.empty:
         return False
 
     try:
-        df.astype(str).to_parquet(filepath, index=False)
+        out_df = df.convert_dtypes()
+
+        # Row groups sorted by date carry tight min/max statistics, letting
+        # the reader's filters skip whole groups outside the requested range.
+        datetime_cols = out_df.select_dtypes(include="datetime").columns
+        if len(datetime_cols) > 0:
+            out_df = out_df.sort_values(datetime_cols[0], kind="stable")
+
+        out_df.to_parquet(
+            filepath,
+            index=False,
+            engine="pyarrow",
+            compression="zstd",
+            compression_level=3,
+            # Moderate row groups + dictionary encoding keep repeated values
+            # (states, agreements, user names) compact and fast to scan;
+            # statistics enable the row-group pruning used by filters=.
+            row_group_size=64_000,
+            use_dictionary=True,
+            write_statistics=True,
+        )
         return True
     except Exception as e:
         print(f"Error al guardar {filepath}: {e}")
         return False
 
 
-def load_from_parquet(filepath):
+def load_from_parquet(filepath, columns=None, filters=None):
     """
     Load a DataFrame from a Parquet file.
+
+    columns optionally projects the read to a subset; parquet's columnar
+    layout means unrequested columns are never touched on disk. filters
+    takes pyarrow predicate tuples (e.g. [("FECHA", ">=", ts)]) that prune
+    row groups via their min/max statistics before any decoding.
     """
     if not os.path.exists(filepath):
         return None
 
     try:
-        return pd.read_parquet(filepath)
+        # Arrow-backed columns load zero-copy from parquet and keep strings
+        # out of object dtype; fall back to numpy dtypes if that path fails.
+        try:
+            return pd.read_parquet(
+                filepath, columns=columns, filters=filters, dtype_backend="pyarrow"
+            )
+        except (ValueError, TypeError):
+            return pd.read_parquet(filepath, columns=columns, filters=filters)
     except Exception as e:
         print(f"Error al cargar {filepath}: {e}")
         return None
 
 
+def iter_parquet_batches(filepath, columns=None, batch_size=65_536):
+    """
+    Yield a Parquet file as pandas DataFrame batches.
+
+    Peak memory tracks batch_size instead of file size, so aggregation
+    passes over files larger than RAM stay flat; combine with columns=
+    to only decode what the pass consumes.
+    """
+    if not os.path.exists(filepath):
+        return
+
+    parquet_file = pq.ParquetFile(filepath)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield batch.to_pandas()
+
+
 def detect_header_row(df_raw, column_marker):
     """
     Detects the header row in a DataFrame.
 
     Looks for a row containing the specified marker to identify where the actual headers begin.
 
+    Runs as a single vectorized numpy pass instead of per-row Series construction.
     """
-    for i, row in df_raw.iterrows():
-        row_str = row.astype(str).str.strip().str.upper()
-        if row_str.str.startswith(column_marker.upper()).any():
-            return i
-    return None
+    if df_raw is None or df_raw.empty:
+        return None
+
+    cells = np.char.upper(np.char.strip(df_raw.to_numpy(dtype=str)))
+    hits = np.char.startswith(cells, column_marker.upper()).any(axis=1)
+    if not hits.any():
+        return None
+    return int(df_raw.index[int(hits.argmax())])
 
 
 def normalize_column_names(df):
@@ -67,26 +142,97 @@ def normalize_column_names(df):
     return df
 
 
+def _read_csv_fast(file, header_row):
+    """
+    Read a CSV preferring the multi-threaded pyarrow engine with Arrow-backed
+    columns; fall back to the default C engine when an option is unsupported.
+    """
+    try:
+        return pd.read_csv(file, header=header_row, engine="pyarrow", dtype_backend="pyarrow")
+    except (ValueError, TypeError, ImportError):
+        file.seek(0)
+        return pd.read_csv(file, header=header_row)
+
+
+def detect_csv_header_row(file, column_marker, max_lines=CSV_HEADER_SCAN_LINES):
+    """
+    Detect the header row of a CSV stream without materializing a DataFrame.
+
+    Scans at most max_lines lines with the stdlib csv reader; pass None to
+    scan the whole stream.
+    """
+    marker = column_marker.upper()
+    file.seek(0)
+    text = io.TextIOWrapper(file, encoding="utf-8", errors="replace", newline="")
+    try:
+        for i, row in enumerate(csv.reader(text)):
+            if max_lines is not None and i > max_lines:
+                return None
+            if any(str(cell).strip().upper().startswith(marker) for cell in row):
+                return i
+        return None
+    finally:
+        # Detach so closing the wrapper does not close the uploaded stream.
+        text.detach()
+
+
+def detect_excel_header_row(file, column_marker, max_row=HEADER_SCAN_ROWS):
+    """
+    Detect the header row of an xlsx upload by streaming rows in openpyxl
+    read-only mode, so detection never materializes the sheet in pandas.
+
+    Scans at most max_row rows (None for the whole sheet); falls back to a
+    pandas prefix read when streaming fails.
+    """
+    marker = column_marker.upper()
+    try:
+        file.seek(0)
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            worksheet = workbook.active
+            rows = worksheet.iter_rows(max_row=max_row, values_only=True)
+            for i, row in enumerate(rows):
+                if any(
+                    str(cell).strip().upper().startswith(marker)
+                    for cell in row
+                    if cell is not None
+                ):
+                    return i
+            return None
+        finally:
+            workbook.close()
+    except Exception:
+        file.seek(0)
+        df_raw = pd.read_excel(file, header=None, nrows=max_row, engine=EXCEL_ENGINE)
+        return detect_header_row(df_raw, column_marker)
+
+
 def read_file_robust(file, column_marker):
     """
     Reads a file robustly by automatically detecting headers.
+
+    Only the first HEADER_SCAN_ROWS rows are parsed to locate the header,
+    so the file body is read exactly once.
     """
     try:
         if file.name.endswith('.csv'):
-            df_raw = pd.read_csv(file, header=None)
+            header_row = detect_csv_header_row(file, column_marker)
+            if header_row is None:
+                # Rare: marker beyond the prefix — rescan without the cap.
+                header_row = detect_csv_header_row(file, column_marker, max_lines=None)
         else:
-            df_raw = pd.read_excel(file, header=None)
-
-        header_row = detect_header_row(df_raw, column_marker)
+            header_row = detect_excel_header_row(file, column_marker)
+            if header_row is None:
+                header_row = detect_excel_header_row(file, column_marker, max_row=None)
 
         if header_row is None:
             return None, None
 
         file.seek(0)
         if file.name.endswith('.csv'):
-            df = pd.read_csv(file, header=header_row)
+            df = _read_csv_fast(file, header_row)
         else:
-            df = pd.read_excel(file, header=header_row)
+            df = pd.read_excel(file, header=header_row, engine=EXCEL_ENGINE)
 
         df = normalize_column_names(df)
 